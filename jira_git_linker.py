@@ -7,11 +7,13 @@ Mocked Jira + Git Merge Request linker.
 - Optional CSV export (via --csv-output filename.csv)
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
-import re
+from typing import DefaultDict, Dict, Iterator, List, Optional, Tuple
 import argparse
 import csv
+import operator
+import sys
 from pathlib import Path
 
 
@@ -19,15 +21,27 @@ from pathlib import Path
 # Data models
 # ---------------------------
 
-@dataclass
+def _intern(value):
+    """
+    Intern plain strings; pass anything else (e.g. None) through unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class JiraIssue:
     key: str
     summary: str
     status: str
     assignee: str
 
+    def __post_init__(self):
+        # Low-cardinality fields repeat across many issues; share one copy
+        self.status = _intern(self.status)
+        self.assignee = _intern(self.assignee)
+
 
-@dataclass
+@dataclass(slots=True)
 class MergeRequest:
     id: int
     title: str
@@ -36,6 +50,11 @@ class MergeRequest:
     author: str
     web_url: str
 
+    def __post_init__(self):
+        # Low-cardinality fields repeat across many MRs; share one copy
+        self.state = _intern(self.state)
+        self.author = _intern(self.author)
+
 
 # ---------------------------
 # Mocked Jira & Git Clients
@@ -64,12 +83,14 @@ class MockJiraClient:
                 "carol",
             ),
         }
+        # Issues are never mutated after construction, so build this once
+        self._all_issues: Tuple[JiraIssue, ...] = tuple(self._issues.values())
 
     def get_issue(self, key: str) -> Optional[JiraIssue]:
         return self._issues.get(key)
 
-    def list_all_issues(self) -> List[JiraIssue]:
-        return list(self._issues.values())
+    def list_all_issues(self) -> Tuple[JiraIssue, ...]:
+        return self._all_issues
 
 
 class MockGitClient:
@@ -110,106 +131,154 @@ class MockGitClient:
 # Linking logic
 # ---------------------------
 
-TICKET_PATTERN = re.compile(r"(MBUX-\d+)", re.IGNORECASE)
+# Ticket IDs are this literal prefix followed by one or more digits.
+# Inputs are uppercased before scanning, so matching is case-insensitive.
+TICKET_PREFIX = "MBUX-"
+_TICKET_PREFIX_LEN = len(TICKET_PREFIX)
 
 
 def extract_ticket_id_from_mr(mr: MergeRequest) -> Optional[str]:
     """
     Extract a Jira ticket ID like MBUX-123 from the MR title or branch.
     """
-    for text in (mr.title, mr.source_branch):
-        m = TICKET_PATTERN.search(text)
-        if m:
-            return m.group(1).upper()
+    # A ticket ID can't span a newline, so a single scan over both
+    # fields still prefers a match in the title over one in the branch.
+    text = f"{mr.title}\n{mr.source_branch}".upper()
+    size = len(text)
+    start = text.find(TICKET_PREFIX)
+    while start >= 0:
+        digits = end = start + _TICKET_PREFIX_LEN
+        while end < size and text[end].isdecimal():
+            end += 1
+        if end > digits:
+            return text[start:end]
+        # Prefix without digits (e.g. "MBUX-WIP"): keep looking
+        start = text.find(TICKET_PREFIX, digits)
     return None
 
 
 def link_jira_and_git(
     jira_client: MockJiraClient,
     git_client: MockGitClient,
-) -> Tuple[List[Tuple[JiraIssue, List[MergeRequest]]], List[MergeRequest]]:
+) -> Tuple[
+    List[Tuple[JiraIssue, List[MergeRequest]]],
+    List[MergeRequest],
+    List[JiraIssue],
+]:
     """
     Returns:
       - list of (JiraIssue, [MRs]) pairs
       - list of MRs that have no linked Jira ticket
+      - list of Jira issues that have no linked MR
     """
     mrs = git_client.list_merge_requests()
-    ticket_to_mrs: Dict[str, List[MergeRequest]] = {}
+    ticket_to_mrs: DefaultDict[str, List[MergeRequest]] = defaultdict(list)
     mrs_without_ticket: List[MergeRequest] = []
 
     for mr in mrs:
         ticket_id = extract_ticket_id_from_mr(mr)
         if ticket_id:
-            ticket_to_mrs.setdefault(ticket_id, []).append(mr)
+            ticket_to_mrs[ticket_id].append(mr)
         else:
             mrs_without_ticket.append(mr)
 
+    # Single pass over Jira: consume matched tickets, collect the rest
     linked: List[Tuple[JiraIssue, List[MergeRequest]]] = []
-    for ticket_id, mrs_for_ticket in ticket_to_mrs.items():
-        issue = jira_client.get_issue(ticket_id)
-        if issue:
+    unlinked_issues: List[JiraIssue] = []
+    for issue in jira_client.list_all_issues():
+        mrs_for_ticket = ticket_to_mrs.pop(issue.key, None)
+        if mrs_for_ticket:
             linked.append((issue, mrs_for_ticket))
         else:
-            # If ticket doesn't exist in Jira, treat MRs as "without ticket"
-            mrs_without_ticket.extend(mrs_for_ticket)
+            unlinked_issues.append(issue)
 
-    return linked, mrs_without_ticket
+    # Whatever is left references tickets unknown to Jira:
+    # treat those MRs as "without ticket"
+    for mrs_for_ticket in ticket_to_mrs.values():
+        mrs_without_ticket.extend(mrs_for_ticket)
+
+    return linked, mrs_without_ticket, unlinked_issues
 
 
 # ---------------------------
 # ASCII Table output
 # ---------------------------
 
-def print_ascii_table(
+# Row templates, bound once so each row is a single C-level format call
+_LINKED_ROW = "{:<10} | {:<12} | {:<10} | {:<5} | {:<8} | {:<8} | {}".format
+_ISSUE_ROW = "{:<10} | {:<12} | {:<10} | {}".format
+_MR_ROW = "{:<5} | {:<8} | {:<8} | {}".format
+
+# Column getters shared by the table and CSV writers (one C call per row)
+_issue_fields = operator.attrgetter("key", "status", "assignee")
+_mr_fields = operator.attrgetter("id", "state", "author", "title")
+
+# Section headers and separators never change, so build them once
+_HEADER = _LINKED_ROW(
+    "Ticket", "Status", "Assignee", "MR ID", "MR State", "Author", "Title"
+)
+_ISSUE_HEADER = _ISSUE_ROW("Ticket", "Status", "Assignee", "Summary")
+_MR_HEADER = _MR_ROW("MR ID", "State", "Author", "Title")
+_SEP_MAIN = "-" * len(_HEADER)
+_SEP_SUB = "-" * 60
+
+
+def _render(
     linked: List[Tuple[JiraIssue, List[MergeRequest]]],
     mrs_without_ticket: List[MergeRequest],
-    jira_client: MockJiraClient,
-) -> None:
+    unlinked_issues: List[JiraIssue],
+) -> Iterator[str]:
     """
-    Print a human-readable ASCII summary.
+    Yield every line of the ASCII summary, all three sections in one pass.
     """
-
-    print("\n=== Jira Tickets with Merge Requests ===\n")
-    header = (
-        f"{'Ticket':<10} | {'Status':<12} | {'Assignee':<10} | "
-        f"{'MR ID':<5} | {'MR State':<8} | {'Author':<8} | Title"
-    )
-    print(header)
-    print("-" * len(header))
-
+    yield "\n=== Jira Tickets with Merge Requests ===\n"
+    yield _HEADER
+    yield _SEP_MAIN
     for issue, mrs in linked:
+        issue_cols = _issue_fields(issue)
         for mr in mrs:
-            print(
-                f"{issue.key:<10} | {issue.status:<12} | {issue.assignee:<10} | "
-                f"{mr.id:<5} | {mr.state:<8} | {mr.author:<8} | {mr.title}"
-            )
+            yield _LINKED_ROW(*issue_cols, *_mr_fields(mr))
 
-    all_ticket_ids = {i.key for i, _ in linked}
+    yield "\n=== Jira Tickets WITHOUT any Merge Request ===\n"
+    yield _ISSUE_HEADER
+    yield _SEP_SUB
+    for issue in unlinked_issues:
+        yield _ISSUE_ROW(*_issue_fields(issue), issue.summary)
 
-    print("\n=== Jira Tickets WITHOUT any Merge Request ===\n")
-    print(f"{'Ticket':<10} | {'Status':<12} | {'Assignee':<10} | Summary")
-    print("-" * 60)
-    for issue in jira_client.list_all_issues():
-        if issue.key not in all_ticket_ids:
-            print(
-                f"{issue.key:<10} | {issue.status:<12} | {issue.assignee:<10} | {issue.summary}"
-            )
-
-    print("\n=== Merge Requests WITHOUT linked Jira Ticket ===\n")
-    print(f"{'MR ID':<5} | {'State':<8} | {'Author':<8} | Title")
-    print("-" * 60)
+    yield "\n=== Merge Requests WITHOUT linked Jira Ticket ===\n"
+    yield _MR_HEADER
+    yield _SEP_SUB
     for mr in mrs_without_ticket:
-        print(f"{mr.id:<5} | {mr.state:<8} | {mr.author:<8} | {mr.title}")
+        yield _MR_ROW(*_mr_fields(mr))
+
+
+def print_ascii_table(
+    linked: List[Tuple[JiraIssue, List[MergeRequest]]],
+    mrs_without_ticket: List[MergeRequest],
+    unlinked_issues: List[JiraIssue],
+) -> None:
+    """
+    Print a human-readable ASCII summary.
+    """
+    # Stream straight into stdout's buffer instead of a print() per row
+    sys.stdout.writelines(
+        line + "\n"
+        for line in _render(linked, mrs_without_ticket, unlinked_issues)
+    )
 
 
 # ---------------------------
 # CSV Export
 # ---------------------------
 
+# Sequential writes only: a large buffer means far fewer write() syscalls
+CSV_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
 def export_csv(
     linked: List[Tuple[JiraIssue, List[MergeRequest]]],
     mrs_without_ticket: List[MergeRequest],
-    jira_client: MockJiraClient,
+    unlinked_issues: List[JiraIssue],
     file_path: Path,
 ) -> None:
     """
@@ -219,7 +288,7 @@ def export_csv(
       - MRs without Jira ticket
     """
 
-    fieldnames = [
+    fieldnames = (
         "ticket_key",
         "ticket_status",
         "ticket_assignee",
@@ -227,57 +296,33 @@ def export_csv(
         "mr_state",
         "mr_author",
         "mr_title",
-    ]
-
-    all_ticket_ids = {i.key for i, _ in linked}
+    )
 
-    with file_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    with file_path.open(
+        "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE
+    ) as f:
+        # Positional rows, in the same order as `fieldnames`
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
 
         # 1) Jira tickets that DO have MRs
-        for issue, mrs in linked:
-            for mr in mrs:
-                writer.writerow(
-                    {
-                        "ticket_key": issue.key,
-                        "ticket_status": issue.status,
-                        "ticket_assignee": issue.assignee,
-                        "mr_id": mr.id,
-                        "mr_state": mr.state,
-                        "mr_author": mr.author,
-                        "mr_title": mr.title,
-                    }
-                )
+        writer.writerows(
+            _issue_fields(i) + _mr_fields(m)
+            for i, mrs in linked
+            for m in mrs
+        )
 
         # 2) Jira tickets WITHOUT any MR
-        for issue in jira_client.list_all_issues():
-            if issue.key not in all_ticket_ids:
-                writer.writerow(
-                    {
-                        "ticket_key": issue.key,
-                        "ticket_status": issue.status,
-                        "ticket_assignee": issue.assignee,
-                        "mr_id": None,
-                        "mr_state": None,
-                        "mr_author": None,
-                        "mr_title": issue.summary,
-                    }
-                )
+        writer.writerows(
+            _issue_fields(i) + (None, None, None, i.summary)
+            for i in unlinked_issues
+        )
 
         # 3) MRs WITHOUT any Jira ticket (Frank will appear here)
-        for mr in mrs_without_ticket:
-            writer.writerow(
-                {
-                    "ticket_key": None,
-                    "ticket_status": None,
-                    "ticket_assignee": None,
-                    "mr_id": mr.id,
-                    "mr_state": mr.state,
-                    "mr_author": mr.author,
-                    "mr_title": mr.title,
-                }
-            )
+        writer.writerows(
+            (None, None, None) + _mr_fields(m)
+            for m in mrs_without_ticket
+        )
 
     print(f"\n[INFO] CSV exported to: {file_path}")
 
@@ -300,14 +345,18 @@ def main():
     jira_client = MockJiraClient()
     git_client = MockGitClient()
 
-    linked, mrs_without_ticket = link_jira_and_git(jira_client, git_client)
+    linked, mrs_without_ticket, unlinked_issues = link_jira_and_git(
+        jira_client, git_client
+    )
 
     # Always show ASCII output
-    print_ascii_table(linked, mrs_without_ticket, jira_client)
+    print_ascii_table(linked, mrs_without_ticket, unlinked_issues)
 
     # Optional CSV export
     if args.csv_output:
-        export_csv(linked, mrs_without_ticket, jira_client, Path(args.csv_output))
+        export_csv(
+            linked, mrs_without_ticket, unlinked_issues, Path(args.csv_output)
+        )
 
 
 if __name__ == "__main__":